@@ -1,32 +1,72 @@
-from dataclasses import dataclass, asdict
-from typing import ClassVar, Dict, Type, List, Union
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (ClassVar, Mapping, Type, Optional, Sequence, Tuple,
+                    Union)
+
+# Константы формул расхода калорий: get_spent_calories читает их как
+# глобальные имена, без поиска атрибутов по MRO. Атрибуты классов
+# COEFF_CALORIE_*, M_IN_KM и MIN_IN_H повторяют эти значения; их
+# переопределение в подклассе на расчёт калорий не влияет (дистанция
+# и средняя скорость по-прежнему используют self.M_IN_KM).
+_M_IN_KM: float = 1000.0
+_MIN_IN_H: float = 60.0
+_RUN_COEFF_1: float = 18.0
+_RUN_COEFF_2: float = 20.0
+_WALK_COEFF_1: float = 0.035
+_WALK_COEFF_2: float = 0.029
+_SWIM_COEFF_1: float = 1.1
 
 
-@dataclass
 class InfoMessage:
     """Информационное сообщение о тренировке."""
 
-    training_type: str
-    duration: float
-    distance: float
-    speed: float
-    calories: float
-    MESSAGE: ClassVar[str] = ('Тип тренировки: {training_type}; '
-                              'Длительность: {duration:.3f} ч.; '
-                              'Дистанция: {distance:.3f} км; '
-                              'Ср. скорость: {speed:.3f} км/ч; '
-                              'Потрачено ккал: {calories:.3f}.')
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
+
+    MESSAGE: ClassVar[str] = ('Тип тренировки: %s; '
+                              'Длительность: %.3f ч.; '
+                              'Дистанция: %.3f км; '
+                              'Ср. скорость: %.3f км/ч; '
+                              'Потрачено ккал: %.3f.')
+    MESSAGE_BYTES: ClassVar[bytes] = (MESSAGE + '\n').encode('utf-8')
+
+    def __init__(self,
+                 training_type: str,
+                 duration: float,
+                 distance: float,
+                 speed: float,
+                 calories: float
+                 ) -> None:
+        self.training_type = training_type
+        self.duration = duration
+        self.distance = distance
+        self.speed = speed
+        self.calories = calories
 
     def get_message(self) -> str:
-        return self.MESSAGE.format(**asdict(self))
+        return self.MESSAGE % (self.training_type,
+                               self.duration,
+                               self.distance,
+                               self.speed,
+                               self.calories)
 
 
 class Training:
     """Базовый класс тренировки."""
 
+    # __dict__ создаётся лениво и нужен только для подмены методов
+    # у конкретного экземпляра; сами данные хранятся в слотах.
+    __slots__ = ('action', 'duration', 'weight', '__dict__')
+
+    TYPE_NAME: ClassVar[str] = 'Training'
     LEN_STEP: float = 0.65
-    M_IN_KM: float = 1000.0
-    MIN_IN_H: float = 60.0
+    M_IN_KM: float = _M_IN_KM
+    MIN_IN_H: float = _MIN_IN_H
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if 'TYPE_NAME' not in cls.__dict__:
+            cls.TYPE_NAME = cls.__name__
 
     def __init__(self,
                  action: float,
@@ -45,13 +85,17 @@ class Training:
         """Получить среднюю скорость движения."""
         return self.get_distance() / self.duration
 
-    def get_spent_calories(self) -> float:
-        """Получить количество затраченных калорий."""
+    def get_spent_calories(self, speed: Optional[float] = None) -> float:
+        """Получить количество затраченных калорий.
+
+        Если средняя скорость уже посчитана, её можно передать в `speed`,
+        чтобы не вычислять повторно.
+        """
         raise NotImplementedError
 
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
-        training_type: str = type(self).__name__
+        training_type: str = self.TYPE_NAME
         distance: float = self.get_distance()
         speed: float = self.get_mean_speed()
         calories: float = self.get_spent_calories()
@@ -65,21 +109,26 @@ class Training:
 class Running(Training):
     """Тренировка: бег."""
 
-    COEFF_CALORIE_1: float = 18.0
-    COEFF_CALORIE_2: float = 20.0
+    __slots__ = ()
 
-    def get_spent_calories(self) -> float:
-        return ((self.COEFF_CALORIE_1 * self.get_mean_speed()
-                 - self.COEFF_CALORIE_2) * self.weight / self.M_IN_KM
-                * self.duration * self.MIN_IN_H)
+    COEFF_CALORIE_1: float = _RUN_COEFF_1
+    COEFF_CALORIE_2: float = _RUN_COEFF_2
+
+    def get_spent_calories(self, speed: Optional[float] = None) -> float:
+        if speed is None:
+            speed = self.get_mean_speed()
+        return ((_RUN_COEFF_1 * speed - _RUN_COEFF_2)
+                * self.weight / _M_IN_KM
+                * self.duration * _MIN_IN_H)
 
 
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
 
-    COEFF_CALORIE_1: float = 0.035
-    COEFF_CALORIE_2: float = 0.029
-    COEFF_CALORIE_3: float = 2.0
+    __slots__ = ('height',)
+
+    COEFF_CALORIE_1: float = _WALK_COEFF_1
+    COEFF_CALORIE_2: float = _WALK_COEFF_2
 
     def __init__(self,
                  action: float,
@@ -90,17 +139,22 @@ class SportsWalking(Training):
         super().__init__(action, duration, weight)
         self.height = height
 
-    def get_spent_calories(self) -> float:
-        return ((self.COEFF_CALORIE_1 * self.weight
-                + (self.get_mean_speed()**self.COEFF_CALORIE_3 // self.height)
-                * self.COEFF_CALORIE_2 * self.weight)
-                * self.duration * self.MIN_IN_H)
+    def get_spent_calories(self, speed: Optional[float] = None) -> float:
+        if speed is None:
+            speed = self.get_mean_speed()
+        # Квадрат скорости считаем умножением, без вызова pow().
+        return ((_WALK_COEFF_1 * self.weight
+                + (speed * speed // self.height)
+                * _WALK_COEFF_2 * self.weight)
+                * self.duration * _MIN_IN_H)
 
 
 class Swimming(Training):
     """Тренировка: плавание."""
 
-    COEFF_CALORIE_1: float = 1.1
+    __slots__ = ('length_pool', 'count_pool')
+
+    COEFF_CALORIE_1: float = _SWIM_COEFF_1
     LEN_STEP: float = 1.38
 
     def __init__(self,
@@ -120,20 +174,24 @@ class Swimming(Training):
                 / self.M_IN_KM
                 / self.duration)
 
-    def get_spent_calories(self) -> float:
-        return ((self.get_mean_speed()
-                + self.COEFF_CALORIE_1)
+    def get_spent_calories(self, speed: Optional[float] = None) -> float:
+        if speed is None:
+            speed = self.get_mean_speed()
+        return ((speed
+                + _SWIM_COEFF_1)
                 * 2 * self.weight)
 
 
-def read_package(workout_type: str, data: List[Union[int, float]]) -> Training:
-    """Прочитать данные полученные от датчиков."""
-    abbreviation_to_training: Dict[str, Type[Training]] = {
-        'SWM': Swimming,
-        'RUN': Running,
-        'WLK': SportsWalking}
+TRAINING_TYPE: Mapping[str, Type[Training]] = MappingProxyType({
+    'SWM': Swimming,
+    'RUN': Running,
+    'WLK': SportsWalking})
+
 
-    return abbreviation_to_training[workout_type](*data)
+def read_package(workout_type: str,
+                 data: Sequence[Union[int, float]]) -> Training:
+    """Прочитать данные полученные от датчиков."""
+    return TRAINING_TYPE[workout_type](*data)
 
 
 def main(training: Training) -> None:
@@ -142,6 +200,38 @@ def main(training: Training) -> None:
     print(info.get_message())
 
 
+UNKNOWN_TYPE_BYTES: bytes = 'Не определен тип тренировки\n'.encode('utf-8')
+
+
+def _format_bytes(training: Training) -> bytes:
+    """Сформировать сообщение о тренировке сразу в байтах."""
+    distance: float = training.get_distance()
+    speed: float = training.get_mean_speed()
+    return InfoMessage.MESSAGE_BYTES % (training.TYPE_NAME.encode('utf-8'),
+                                        training.duration,
+                                        distance,
+                                        speed,
+                                        training.get_spent_calories(speed))
+
+
+def _write_bytes(message: bytes) -> None:
+    """Записать байты в stdout; для текстовых потоков без buffer — print."""
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        print(message.decode('utf-8'), end='')
+    else:
+        buffer.write(message)
+
+
+# typed=False: пакеты (15000, 1, 75) и (15000, 1.0, 75) попадают в одну
+# запись кэша. Это безопасно, так как числа в сообщении выводятся через
+# %.3f и для int и float одного значения строка получается одинаковой.
+@lru_cache(maxsize=1024)
+def _render(workout_type: str, data: Tuple[Union[int, float], ...]) -> bytes:
+    """Сообщение для пакета; повторяющиеся пакеты берутся из кэша."""
+    return _format_bytes(read_package(workout_type, data))
+
+
 if __name__ == '__main__':
     packages = [
         ('SWM', [720, 1, 80, 25, 40]),
@@ -151,8 +241,8 @@ if __name__ == '__main__':
 
     for workout_type, data in packages:
         try:
-            training = read_package(workout_type, data)
+            message = _render(workout_type, tuple(data))
         except KeyError:
-            print('Не определен тип тренировки')
+            _write_bytes(UNKNOWN_TYPE_BYTES)
         else:
-            main(training)
+            _write_bytes(message)
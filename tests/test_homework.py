@@ -363,3 +363,81 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+@pytest.mark.parametrize('input_data, expected', [
+    (['SWM', [720, 1, 80, 25, 40]], 3376.0),
+    (['RUN', [1206, 12, 6]], 1468.8),
+    (['WLK', [9000, 1, 75, 180]], 418.5000000000001),
+])
+def test_get_spent_calories_with_speed(input_data, expected):
+    training = homework.read_package(*input_data)
+    result = training.get_spent_calories(20.0)
+    assert result != training.get_spent_calories(), (
+        'Метод `get_spent_calories` должен использовать переданную '
+        'скорость, а не пересчитывать среднюю.'
+    )
+    assert result == expected, (
+        'Проверьте формулу расчёта калорий с переданной скоростью.'
+    )
+
+
+def test_show_training_info_subclass_name():
+    class Trail(homework.Running):
+        pass
+
+    result = Trail(9000, 1, 75).show_training_info()
+    assert result.training_type == 'Trail', (
+        'Метод `show_training_info` должен указывать в сообщении '
+        'имя класса тренировки.'
+    )
+
+    class Custom(homework.Running):
+        TYPE_NAME = 'CustomName'
+
+    result = Custom(9000, 1, 75).show_training_info()
+    assert result.training_type == 'CustomName', (
+        'Заданный в подклассе `TYPE_NAME` не должен перезаписываться.'
+    )
+
+
+@pytest.mark.parametrize('input_data', [
+    (['SWM', [720, 1, 80, 25, 40]]),
+    (['RUN', [1206, 12, 6]]),
+    (['WLK', [9000, 1, 75, 180]]),
+])
+def test_format_bytes_matches_main(input_data):
+    training = homework.read_package(*input_data)
+    with Capturing() as main_output:
+        homework.main(training)
+    result = homework._format_bytes(training).decode('utf-8')
+    assert result.splitlines() == main_output, (
+        'Сообщение, которое выводит скрипт, должно совпадать '
+        'с выводом функции `main`.'
+    )
+
+
+def test_write_bytes_without_buffer():
+    with Capturing() as output:
+        homework._write_bytes(homework.UNKNOWN_TYPE_BYTES)
+    assert output == ['Не определен тип тренировки'], (
+        'Без `sys.stdout.buffer` сообщение должно выводиться через `print`.'
+    )
+
+
+def test_render_cached():
+    homework._render.cache_clear()
+    first = homework._render('RUN', (15000, 1, 75))
+    second = homework._render('RUN', (15000, 1.0, 75))
+    assert first == second, (
+        'Повторный пакет должен давать то же сообщение.'
+    )
+    assert homework._render.cache_info().hits == 1, (
+        'Повторный пакет должен браться из кэша.'
+    )
+
+
+def test_render_unknown_type():
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            homework._render('XXX', (1, 1, 1))